@@ -6,8 +6,57 @@ from openpype.lib import Logger
 from openpype.client import get_assets, get_asset_by_name
 
 
+def get_asset_docs_by_lower_name(project_name, all_selected_asset_ids=None):
+    """Query asset documents once and index them by lowercased name.
+
+    Result can be passed to parsing functions to resolve many file names
+    without a database query per file.
+
+    Args:
+        project_name (str): Project name.
+        all_selected_asset_ids (Optional[Iterable[str]]): Limit query to
+            these asset ids.
+
+    Returns:
+        dict[str, list[dict]]: Asset documents by lowercased asset name.
+    """
+    asset_docs_by_lower_name = {}
+    for asset_doc in get_assets(
+        project_name, asset_ids=all_selected_asset_ids
+    ):
+        asset_docs_by_lower_name.setdefault(
+            asset_doc["name"].lower(), []
+        ).append(asset_doc)
+    return asset_docs_by_lower_name
+
+
+def get_asset_names_regex(asset_lower_names):
+    """Compile one pattern matching any of passed asset names.
+
+    Longer names are listed first so an asset is not shadowed by another
+    asset whose name is its prefix. Build it once per batch of files and
+    pass it to 'parse_containing'.
+
+    Args:
+        asset_lower_names (Iterable[str]): Lowercased asset names.
+
+    Returns:
+        Union[re.Pattern, None]: Compiled pattern or None if no names
+            were passed.
+    """
+    asset_lower_names = sorted(asset_lower_names, key=len, reverse=True)
+    if not asset_lower_names:
+        return None
+    return re.compile("|".join(
+        re.escape(asset_name)
+        for asset_name in asset_lower_names
+    ))
+
+
 def get_asset_doc_from_file_name(source_filename, project_name,
-                                 version_regex, all_selected_asset_ids=None):
+                                 version_regex, all_selected_asset_ids=None,
+                                 asset_docs_by_lower_name=None,
+                                 asset_names_regex=None):
     """Try to parse out asset name from file name provided.
 
     Artists might provide various file name formats.
@@ -15,28 +64,43 @@ def get_asset_doc_from_file_name(source_filename, project_name,
         - chair.mov
         - chair_v001.mov
         - my_chair_to_upload.mov
+
+    Pass 'asset_docs_by_lower_name' (see 'get_asset_docs_by_lower_name')
+    and 'asset_names_regex' (see 'get_asset_names_regex') when parsing
+    multiple files to avoid database queries and regex builds per file.
     """
     version = None
     asset_name = os.path.splitext(source_filename)[0]
     # Always first check if source filename is directly asset (eg. 'chair.mov')
     matching_asset_doc = get_asset_by_name_case_not_sensitive(
-        project_name, asset_name, all_selected_asset_ids)
+        project_name, asset_name, all_selected_asset_ids,
+        asset_docs_by_lower_name=asset_docs_by_lower_name)
 
     if matching_asset_doc is None:
         # name contains also a version
-        matching_asset_doc, version = (
-            parse_with_version(project_name, asset_name, version_regex,
-                               all_selected_asset_ids))
+        matching_asset_doc, version = parse_with_version(
+            project_name,
+            asset_name,
+            version_regex,
+            all_selected_asset_ids,
+            asset_docs_by_lower_name=asset_docs_by_lower_name
+        )
 
     if matching_asset_doc is None:
-        matching_asset_doc = parse_containing(project_name, asset_name,
-                                              all_selected_asset_ids)
+        matching_asset_doc = parse_containing(
+            project_name,
+            asset_name,
+            all_selected_asset_ids,
+            asset_docs_by_lower_name=asset_docs_by_lower_name,
+            asset_names_regex=asset_names_regex
+        )
 
     return matching_asset_doc, version
 
 
 def parse_with_version(project_name, asset_name, version_regex,
-                       all_selected_asset_ids=None, log=None):
+                       all_selected_asset_ids=None, log=None,
+                       asset_docs_by_lower_name=None):
     """Try to parse asset name from a file name containing version too
 
     Eg. 'chair_v001.mov' >> 'chair', 1
@@ -54,31 +118,75 @@ def parse_with_version(project_name, asset_name, version_regex,
         _asset_name, _version_number = regex_result[0]
         matching_asset_doc = get_asset_by_name_case_not_sensitive(
             project_name, _asset_name,
-            all_selected_asset_ids=all_selected_asset_ids)
+            all_selected_asset_ids=all_selected_asset_ids,
+            asset_docs_by_lower_name=asset_docs_by_lower_name)
         if matching_asset_doc:
             version_number = int(_version_number)
 
     return matching_asset_doc, version_number
 
 
-def parse_containing(project_name, asset_name, all_selected_asset_ids=None):
-    """Look if file name contains any existing asset name"""
-    for asset_doc in get_assets(project_name, asset_ids=all_selected_asset_ids,
-                                fields=["name"]):
-        if asset_doc["name"].lower() in asset_name.lower():
-            return get_asset_by_name(project_name, asset_doc["name"])
+def parse_containing(project_name, asset_name, all_selected_asset_ids=None,
+                     asset_docs_by_lower_name=None, asset_names_regex=None):
+    """Look if file name contains any existing asset name
+
+    If file name contains more asset names, the one starting first in the
+    file name is used, and the longest one of those starting at the same
+    position. Eg. 'sh010_chair' >> 'sh010' for assets 'chair', 'sh01'
+    and 'sh010'.
+    """
+    if asset_docs_by_lower_name is not None:
+        asset_lower_names = asset_docs_by_lower_name.keys()
+    else:
+        asset_names_by_lower_name = {
+            asset_doc["name"].lower(): asset_doc["name"]
+            for asset_doc in get_assets(
+                project_name,
+                asset_ids=all_selected_asset_ids,
+                fields=["name"]
+            )
+        }
+        asset_lower_names = asset_names_by_lower_name.keys()
+        # Regex passed from caller can't be used with queried names
+        asset_names_regex = None
+
+    if asset_names_regex is None:
+        asset_names_regex = get_asset_names_regex(asset_lower_names)
+
+    if asset_names_regex is None:
+        return None
+
+    match = asset_names_regex.search(asset_name.lower())
+    if not match:
+        return None
+
+    asset_lower_name = match.group(0)
+    if asset_docs_by_lower_name is not None:
+        return asset_docs_by_lower_name[asset_lower_name][0]
+    return get_asset_by_name(
+        project_name, asset_names_by_lower_name[asset_lower_name]
+    )
 
 
 def get_asset_by_name_case_not_sensitive(project_name, asset_name,
                                          all_selected_asset_ids=None,
-                                         log=None):
+                                         log=None,
+                                         asset_docs_by_lower_name=None):
     """Handle more cases in file names"""
     if not log:
         log = Logger.get_logger(__name__)
-    asset_name = re.compile(asset_name, re.IGNORECASE)
 
-    assets = list(get_assets(project_name, asset_ids=all_selected_asset_ids,
-                             asset_names=[asset_name]))
+    if asset_docs_by_lower_name is not None:
+        assets = list(asset_docs_by_lower_name.get(asset_name.lower(), []))
+    else:
+        # Anchored and escaped so only whole names match, same as lookup
+        #   in prefetched documents
+        asset_name = re.compile(
+            "^{}$".format(re.escape(asset_name)), re.IGNORECASE
+        )
+        assets = list(get_assets(project_name,
+                                 asset_ids=all_selected_asset_ids,
+                                 asset_names=[asset_name]))
     if assets:
         if len(assets) > 1:
             log.warning("Too many records found for {}".format(
@@ -18,7 +18,9 @@ from openpype.pipeline.create import (
 
 from openpype.hosts.traypublisher.api.plugin import TrayPublishCreator
 from openpype.hosts.traypublisher.batch_parsing import (
-    get_asset_doc_from_file_name
+    get_asset_docs_by_lower_name,
+    get_asset_names_regex,
+    get_asset_doc_from_file_name,
 )
 
 
@@ -54,6 +56,13 @@ class BatchMovieCreator(TrayPublishCreator):
         if not file_paths:
             return
 
+        # Query assets once for all files instead of once per file
+        asset_docs_by_lower_name = get_asset_docs_by_lower_name(
+            self.project_name
+        )
+        asset_names_regex = get_asset_names_regex(
+            asset_docs_by_lower_name.keys()
+        )
         for file_info in file_paths:
             instance_data = copy.deepcopy(data)
             file_name = file_info["filenames"][0]
@@ -61,7 +70,12 @@ class BatchMovieCreator(TrayPublishCreator):
             instance_data["creator_attributes"] = {"filepath": filepath}
 
             asset_doc, version = get_asset_doc_from_file_name(
-                file_name, self.project_name, self.version_regex)
+                file_name,
+                self.project_name,
+                self.version_regex,
+                asset_docs_by_lower_name=asset_docs_by_lower_name,
+                asset_names_regex=asset_names_regex
+            )
 
             subset_name, task_name = self._get_subset_and_task(
                 asset_doc, data["variant"], self.project_name)
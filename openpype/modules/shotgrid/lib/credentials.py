@@ -1,9 +1,6 @@
 
 from urllib.parse import urlparse
 
-import shotgun_api3
-from shotgun_api3.shotgun import AuthenticationFault
-
 from openpype.lib import OpenPypeSecureRegistry, OpenPypeSettingsRegistry
 from openpype.modules.shotgrid.lib.record import Credentials
 
@@ -112,6 +109,11 @@ def check_credentials(
 
     if not shotgrid_url or not login or not password:
         return False
+
+    # Shotgrid API is imported lazily so tray startup doesn't pay for it
+    import shotgun_api3
+    from shotgun_api3.shotgun import AuthenticationFault
+
     try:
         session = shotgun_api3.Shotgun(
             shotgrid_url,
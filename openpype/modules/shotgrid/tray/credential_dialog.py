@@ -100,8 +100,18 @@ class CredentialsDialog(QtWidgets.QDialog):
         servers = settings.get_shotgrid_servers()
 
         if servers:
-            for _, v in servers.items():
-                self.url_input.addItem("{}".format(v.get('shotgrid_url')))
+            server_urls = [
+                "{}".format(v.get("shotgrid_url"))
+                for v in servers.values()
+            ]
+            current_urls = [
+                self.url_input.itemText(idx)
+                for idx in range(self.url_input.count())
+            ]
+            # Dialog is filled on each show, rebuild items only on change
+            if server_urls != current_urls:
+                self.url_input.clear()
+                self.url_input.addItems(server_urls)
             self._valid_input(self.url_input)
             self.login_button.show()
             self.logout_button.show()
@@ -126,6 +136,7 @@ class CredentialsDialog(QtWidgets.QDialog):
         self.login_input.setText("")
         self.password_input.setText("")
 
+    @QtCore.Slot()
     def _on_shotgrid_login_clicked(self):
         login = self.login_input.text().strip()
         password = self.password_input.text().strip()
@@ -161,9 +172,10 @@ class CredentialsDialog(QtWidgets.QDialog):
 
         self.set_error("CANT LOGIN")
 
+    @QtCore.Slot()
     def _on_shotgrid_logout_clicked(self):
         credentials.clear_local_login()
-        del os.environ['OPENPYPE_SG_USER']
+        os.environ.pop("OPENPYPE_SG_USER", None)
         self._clear_shotgrid_login()
         self._on_logout()
 
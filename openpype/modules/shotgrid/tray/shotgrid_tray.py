@@ -16,8 +16,6 @@ class ShotgridTrayWrapper:
 
     def __init__(self, module):
         self.module = module
-        self.credentials_dialog = CredentialsDialog(module)
-        self.credentials_dialog.login_changed.connect(self.set_login_label)
         self.logged_user_label = QtWidgets.QAction("")
         self.logged_user_label.setDisabled(True)
         self.set_login_label()
@@ -29,10 +27,20 @@ class ShotgridTrayWrapper:
     def show_connect_dialog(self):
         self.show_credential_dialog()
 
+    def _get_credentials_dialog(self):
+        # Dialog is created on first use to keep tray startup light
+        if self.credentials_dialog is None:
+            self.credentials_dialog = CredentialsDialog(self.module)
+            self.credentials_dialog.login_changed.connect(
+                self.set_login_label
+            )
+        return self.credentials_dialog
+
     def show_credential_dialog(self):
-        self.credentials_dialog.show()
-        self.credentials_dialog.activateWindow()
-        self.credentials_dialog.raise_()
+        credentials_dialog = self._get_credentials_dialog()
+        credentials_dialog.show()
+        credentials_dialog.activateWindow()
+        credentials_dialog.raise_()
 
     def set_login_label(self):
         login = credentials.get_local_login()
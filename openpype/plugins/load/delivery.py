@@ -1,5 +1,6 @@
 import copy
-import platform
+import functools
+import sys
 from collections import defaultdict
 
 from qtpy import QtWidgets, QtCore, QtGui
@@ -57,6 +58,11 @@ class Delivery(load.SubsetLoaderPlugin):
 class DeliveryOptionsDialog(QtWidgets.QDialog):
     """Dialog to select template where to deliver selected representations."""
 
+    # Emitted from delivery thread with number of delivered files
+    files_delivered = QtCore.Signal(int)
+    # Report is cut after this many items to keep the dialog responsive
+    report_max_items = 5000
+
     def __init__(self, contexts, log=None, parent=None):
         super(DeliveryOptionsDialog, self).__init__(parent=parent)
 
@@ -77,14 +83,17 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         self._representations = None
         self.log = log
         self.currently_uploaded = 0
+        self._files_to_deliver = 0
+        self._delivery_thread = None
+        self._report_items = None
 
         self._set_representations(project_name, contexts)
 
         dropdown = QtWidgets.QComboBox()
         self.templates = self._get_templates(self.anatomy)
-        for name, _ in self.templates.items():
-            dropdown.addItem(name)
-        if self.templates and platform.system() == "Darwin":
+        for name, template in self.templates.items():
+            dropdown.addItem(name, template)
+        if self.templates and sys.platform == "darwin":
             # fix macos QCombobox Style
             dropdown.setItemDelegate(QtWidgets.QStyledItemDelegate())
             # update combo box length to longest entry
@@ -107,12 +116,15 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         repre_checkboxes_layout.setContentsMargins(10, 5, 5, 10)
 
         self._representation_checkboxes = {}
+        self._selected_repre_names = set()
         for repre in self._get_representation_names():
             checkbox = QtWidgets.QCheckBox()
             checkbox.setChecked(False)
             self._representation_checkboxes[repre] = checkbox
 
-            checkbox.stateChanged.connect(self._update_selected_label)
+            checkbox.toggled.connect(
+                functools.partial(self._on_repre_toggle, repre)
+            )
             repre_checkboxes_layout.addRow(repre, checkbox)
 
         selected_label = QtWidgets.QLabel()
@@ -137,7 +149,7 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         progress_bar.setMaximum = 100
         progress_bar.setVisible(False)
 
-        text_area = QtWidgets.QTextEdit()
+        text_area = QtWidgets.QPlainTextEdit()
         text_area.setReadOnly(True)
         text_area.setVisible(False)
         text_area.setMinimumHeight(100)
@@ -150,6 +162,7 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         layout.addWidget(progress_bar)
         layout.addWidget(text_area)
 
+        self.input_widget = input_widget
         self.selected_label = selected_label
         self.template_label = template_label
         self.dropdown = dropdown
@@ -168,6 +181,7 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
 
         btn_delivery.clicked.connect(self.deliver)
         dropdown.currentIndexChanged.connect(self._update_template_value)
+        self.files_delivered.connect(self._update_progress)
 
         if not self.dropdown.count():
             self.text_area.setVisible(True)
@@ -175,24 +189,92 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
                 "No Delivery Templates found!\n"
                 "Add Template in [project_anatomy/templates/delivery]"
             )
-            self.text_area.setText(error_message)
+            self.text_area.setPlainText(error_message)
             self.log.error(error_message.replace("\n", " "))
 
+    def reject(self):
+        # Don't close the dialog while files are being delivered
+        if (
+            self._delivery_thread is not None
+            and self._delivery_thread.isRunning()
+        ):
+            return
+        super(DeliveryOptionsDialog, self).reject()
+
+    @QtCore.Slot()
     def deliver(self):
         """Main method to loop through all selected representations"""
+        # Imported here to not load tools widgets in every host with loaders
+        from openpype.tools.utils import DynamicQThread
+
+        if (
+            self._delivery_thread is not None
+            and self._delivery_thread.isRunning()
+        ):
+            return
+
         self.progress_bar.setVisible(True)
         self.btn_delivery.setEnabled(False)
-        QtWidgets.QApplication.processEvents()
+        # Selection can't change while files are delivered
+        self.input_widget.setEnabled(False)
+        self.currently_uploaded = 0
+        self._files_to_deliver = self.files_selected
+
+        # Widget values are read here, files are copied in thread so the
+        #   dialog stays responsive
+        # - thread is parented to dialog and kept until next delivery,
+        #   'finished' is emitted before the thread actually exits
+        thread = DynamicQThread(
+            self._deliver,
+            args=(
+                self._get_selected_repres(),
+                self.dropdown.currentText(),
+                self.root_line_edit.text(),
+                self.renumber_frame.isChecked(),
+                self.first_frame_start.value(),
+            ),
+            parent=self
+        )
+        thread.finished.connect(self._on_delivery_finished)
+        self._delivery_thread = thread
+        thread.start()
+
+    def _deliver(
+        self,
+        selected_repres,
+        template_name,
+        root,
+        renumber_frame,
+        frame_offset
+    ):
+        """Deliver selected representations.
+
+        Called in delivery thread, must not touch widgets directly.
+        """
+        try:
+            self._report_items = self._deliver_representations(
+                selected_repres,
+                template_name,
+                root,
+                renumber_frame,
+                frame_offset
+            )
+        except Exception:
+            self.log.error("Failed to deliver versions.", exc_info=True)
 
+    def _deliver_representations(
+        self,
+        selected_repres,
+        template_name,
+        root,
+        renumber_frame,
+        frame_offset
+    ):
+        """Copy files of selected representations and return report items."""
         report_items = defaultdict(list)
 
-        selected_repres = self._get_selected_repres()
-
         datetime_data = get_datetime_data()
-        template_name = self.dropdown.currentText()
-        format_dict = get_format_dict(self.anatomy, self.root_line_edit.text())
-        renumber_frame = self.renumber_frame.isChecked()
-        frame_offset = self.first_frame_start.value()
+        format_dict = get_format_dict(self.anatomy, root)
         for repre in self._representations:
             if repre["name"] not in selected_repres:
                 continue
@@ -258,20 +340,32 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
                         anatomy_data["frame"] = frame
                     new_report_items, uploaded = deliver_single_file(*args)
                     report_items.update(new_report_items)
-                    self._update_progress(uploaded)
+                    self.files_delivered.emit(uploaded)
             else:  # fallback for Pype2 and representations without files
                 frame = repre['context'].get('frame')
                 if frame:
                     repre["context"]["frame"] = len(str(frame)) * "#"
 
-                if not frame:
-                    new_report_items, uploaded = deliver_single_file(*args)
-                else:
-                    new_report_items, uploaded = deliver_sequence(*args)
+                deliver_func = deliver_single_file
+                if frame:
+                    deliver_func = deliver_sequence
+                new_report_items, uploaded = deliver_func(*args)
                 report_items.update(new_report_items)
-                self._update_progress(uploaded)
+                self.files_delivered.emit(uploaded)
+
+        return report_items
+
+    @QtCore.Slot()
+    def _on_delivery_finished(self):
+        report_items = self._report_items
+        self._report_items = None
+        self.input_widget.setEnabled(True)
+        if report_items is None:
+            report_items = {
+                "Delivery failed": ["See log for details"]
+            }
 
-        self.text_area.setText(self._format_report(report_items))
+        self._set_report_html(self._format_report(report_items))
         self.text_area.setVisible(True)
 
     def _get_representation_names(self):
@@ -323,13 +417,16 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         return label
 
     def _get_selected_repres(self):
-        """Returns list of representation names filtered from checkboxes."""
-        selected_repres = []
-        for repre_name, chckbox in self._representation_checkboxes.items():
-            if chckbox.isChecked():
-                selected_repres.append(repre_name)
+        """Returns list of selected representation names, unordered."""
+        return list(self._selected_repre_names)
 
-        return selected_repres
+    def _on_repre_toggle(self, repre_name, checked):
+        """Keep selected representation names in sync with checkboxes."""
+        if checked:
+            self._selected_repre_names.add(repre_name)
+        else:
+            self._selected_repre_names.discard(repre_name)
+        self._update_selected_label()
 
     def _update_selected_label(self):
         """Updates label with list of number of selected files."""
@@ -341,21 +438,38 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         if self.dropdown.count():
             self.btn_delivery.setEnabled(bool(selected_repres))
 
+    @QtCore.Slot(int)
     def _update_template_value(self, _index=None):
         """Sets template value to label after selection in dropdown."""
-        name = self.dropdown.currentText()
-        template_value = self.templates.get(name)
+        template_value = self.dropdown.currentData()
         if template_value:
             self.template_label.setText(template_value)
             self.btn_delivery.setEnabled(bool(self._get_selected_repres()))
 
+    @QtCore.Slot(int)
     def _update_progress(self, uploaded):
         """Update progress bar after each repre copied."""
         self.currently_uploaded += uploaded
 
-        ratio = self.currently_uploaded / self.files_selected
+        if not self._files_to_deliver:
+            return
+        ratio = self.currently_uploaded / self._files_to_deliver
         self.progress_bar.setValue(ratio * self.progress_bar.maximum())
 
+    def _set_report_html(self, html):
+        """Replace report content without intermediate repaints."""
+        text_area = self.text_area
+        text_area.setUpdatesEnabled(False)
+        text_area.blockSignals(True)
+        text_area.setUndoRedoEnabled(False)
+        try:
+            text_area.clear()
+            text_area.appendHtml(html)
+        finally:
+            text_area.setUndoRedoEnabled(True)
+            text_area.blockSignals(False)
+            text_area.setUpdatesEnabled(True)
+
     def _format_report(self, report_items):
         """Format final result and error details as html."""
         msg = "Delivery finished"
@@ -363,10 +477,24 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
             msg += " successfully"
         else:
             msg += " with errors"
-        txt = "<h2>{}</h2>".format(msg)
+        parts = ["<h2>{}</h2>".format(msg)]
+        items_left = self.report_max_items
+        skipped_count = 0
         for header, data in report_items.items():
-            txt += "<h3>{}</h3>".format(header)
-            for item in data:
-                txt += "{}<br>".format(item)
+            if items_left <= 0:
+                skipped_count += len(data)
+                continue
+            parts.append("<h3>{}</h3>".format(header))
+            shown_data = data[:items_left]
+            parts.extend("{}<br>".format(item) for item in shown_data)
+            items_left -= len(shown_data)
+            skipped_count += len(data) - len(shown_data)
+
+        if skipped_count:
+            parts.append(
+                "<br>... {} more report items were not shown".format(
+                    skipped_count
+                )
+            )
 
-        return txt
+        return "".join(parts)
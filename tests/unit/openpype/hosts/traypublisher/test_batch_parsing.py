@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""Test parsing of asset names from batch file names.
+
+Database functions are replaced by fake project with assets 'chair',
+'sh01' and 'sh010'.
+"""
+import re
+
+import pytest
+
+from openpype.hosts.traypublisher import batch_parsing
+
+PROJECT_NAME = "test_project"
+VERSION_REGEX = re.compile(r"^(.+)_v([0-9]+)$")
+ASSET_DOCS = [
+    {"_id": "1", "name": "chair"},
+    {"_id": "2", "name": "sh01"},
+    {"_id": "3", "name": "sh010"},
+]
+
+
+def _fake_get_assets(project_name, asset_ids=None, asset_names=None,
+                     fields=None):
+    for asset_doc in ASSET_DOCS:
+        if asset_names is not None and not any(
+            asset_name.search(asset_doc["name"])
+            if hasattr(asset_name, "search")
+            else asset_name == asset_doc["name"]
+            for asset_name in asset_names
+        ):
+            continue
+        yield dict(asset_doc)
+
+
+def _fake_get_asset_by_name(project_name, asset_name, fields=None):
+    for asset_doc in ASSET_DOCS:
+        if asset_doc["name"] == asset_name:
+            return dict(asset_doc)
+    return None
+
+
+@pytest.fixture(autouse=True)
+def fake_database(monkeypatch):
+    monkeypatch.setattr(batch_parsing, "get_assets", _fake_get_assets)
+    monkeypatch.setattr(
+        batch_parsing, "get_asset_by_name", _fake_get_asset_by_name)
+
+
+def _parse(file_name, prefetched):
+    kwargs = {}
+    if prefetched:
+        asset_docs_by_lower_name = (
+            batch_parsing.get_asset_docs_by_lower_name(PROJECT_NAME)
+        )
+        kwargs = {
+            "asset_docs_by_lower_name": asset_docs_by_lower_name,
+            "asset_names_regex": batch_parsing.get_asset_names_regex(
+                asset_docs_by_lower_name.keys()
+            )
+        }
+    asset_doc, version = batch_parsing.get_asset_doc_from_file_name(
+        file_name, PROJECT_NAME, VERSION_REGEX, **kwargs
+    )
+    asset_name = asset_doc["name"] if asset_doc else None
+    return asset_name, version
+
+
+@pytest.mark.parametrize("prefetched", [False, True])
+@pytest.mark.parametrize("file_name,expected", [
+    ("chair.mov", ("chair", None)),
+    ("CHAIR.mov", ("chair", None)),
+    ("chair_v003.mov", ("chair", 3)),
+    ("my_chair_to_upload.mov", ("chair", None)),
+    # Leftmost contained asset name is used, longest at same position
+    ("sh010_chair.mov", ("sh010", None)),
+    ("chair_sh010.mov", ("chair", None)),
+    ("sh011_comp.mov", ("sh01", None)),
+    ("table.mov", (None, None)),
+])
+def test_get_asset_doc_from_file_name(file_name, expected, prefetched):
+    assert _parse(file_name, prefetched) == expected
+
+
+def test_asset_names_regex_without_names():
+    assert batch_parsing.get_asset_names_regex([]) is None